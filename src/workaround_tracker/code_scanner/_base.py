@@ -2,11 +2,13 @@ import abc
 import re
 import typing
 
-_URL_REGEX = re.compile(r"https?://[^ \n]+")
+# Bind the compiled pattern's search method once to avoid a method lookup
+# on every call; this runs once per workaround comment line.
+_URL_SEARCH = re.compile(r"https?://\S+").search
 
 
 def find_first_url_in_text(text: str) -> typing.Optional[str]:
-    match: typing.Optional[re.Match[str]] = _URL_REGEX.search(text)
+    match: typing.Optional[re.Match[str]] = _URL_SEARCH(text)
     if match is None:
         return None
     return match.group(0)
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import json
 import logging
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+import orjson
 import pydantic
 
 if TYPE_CHECKING:  # pragma: no cover
     import sys
     from collections.abc import Container, Generator, Iterable, Mapping
-    from pathlib import Path
 
     from ._base import CodeScanner
 
@@ -19,12 +21,31 @@ if TYPE_CHECKING:  # pragma: no cover
     else:
         from typing_extensions import Self
 
-from workaround_tracker.common import ConsistentPath, Workaround, WorkaroundTrackerError
+from workaround_tracker.common import (
+    ConsistentPath,
+    Workaround,
+    WorkaroundData,
+    WorkaroundTrackerError,
+)
 
 from ._python import PythonCodeScanner
 
 LOGGER = logging.getLogger(__name__)
 
+# Scanning is CPU-bound regex work, but worker processes only pay off once
+# there are enough stale files to amortize their startup cost.
+PARALLEL_SCAN_MIN_FILES = 8
+
+
+def _scan_file_worker(
+    code_scanner: CodeScanner, path: Path
+) -> tuple[list[tuple[int, str]], float]:
+    """Scan a single file; top-level so worker processes can pickle it."""
+    # 128 KiB buffer instead of the 8 KiB default, cutting the number of
+    # read syscalls on cold reads of larger files.
+    with path.open(buffering=1 << 17) as file_to_scan:
+        return list(code_scanner.scan_file(file_to_scan)), time.time()
+
 
 class NoCodeScannersError(WorkaroundTrackerError):
     """Raised when there are no code scanners so code cannot be scanned."""
@@ -43,18 +64,44 @@ class CodeScannerCache(pydantic.BaseModel):
     files: dict[ConsistentPath, FileScanCache] = pydantic.Field(default_factory=dict)
 
     @classmethod
-    def _from_dict(cls: type[Self], d: dict[str, Any]) -> Self:
-        return cls.model_validate(d)
+    def _from_dict(cls, d: dict[str, Any], *, trusted: bool = True) -> CodeScannerCache:
+        if not trusted:
+            return _CACHE_ADAPTER.validate_python(d)
+        # The cache is written by our own serializer, so skip revalidating
+        # every cached workaround and construct the models directly.
+        return cls.model_construct(
+            files={
+                Path(file): FileScanCache.model_construct(
+                    workarounds=[
+                        Workaround.model_construct(
+                            file=Path(workaround["file"]),
+                            line=workaround["line"],
+                            url=workaround["url"],
+                        )
+                        for workaround in file_scan_cache["workarounds"]
+                    ],
+                    timestamp=file_scan_cache["timestamp"],
+                )
+                for file, file_scan_cache in d["files"].items()
+            }
+        )
 
     @classmethod
-    def from_json_file(cls: type[Self], cache_file: Path) -> Self:
-        with cache_file.open() as cache_filehandle:
-            cache_content = json.load(cache_filehandle)
-        return cls._from_dict(cache_content)
+    def from_json_file(
+        cls, cache_file: Path, *, trusted: bool = True
+    ) -> CodeScannerCache:
+        with cache_file.open(mode="rb") as cache_filehandle:
+            cache_content = orjson.loads(cache_filehandle.read())
+        return cls._from_dict(cache_content, trusted=trusted)
 
     def write_to_json_file(self, cache_file: Path) -> None:
-        with cache_file.open(mode="w") as cache_filehandle:
-            json.dump(self.model_dump(mode="json"), cache_filehandle)
+        cache_file.write_bytes(_CACHE_ADAPTER.dump_json(self))
+
+
+# Built once at import so validation reuses the same compiled pydantic-core
+# validator and serialization runs end-to-end in pydantic-core, without the
+# Python-dict intermediate of model_dump(mode="json").
+_CACHE_ADAPTER = pydantic.TypeAdapter(CodeScannerCache)
 
 
 class CodeScannerManager:
@@ -62,11 +109,17 @@ class CodeScannerManager:
         self,
         code_scanners: Iterable[CodeScanner],
         cache: CodeScannerCache | None = None,
+        jobs: int | None = None,
     ) -> None:
         if not code_scanners:
             raise NoCodeScannersError("No code scanners provided")
         self._code_scanners = list(code_scanners)
         self._cache = cache or CodeScannerCache()
+        # None means one worker per core; 1 disables worker processes.
+        self._jobs = jobs
+        # Checked once here so the per-file and per-match debug calls below
+        # cost a single attribute lookup when debug logging is off.
+        self._log_debug = LOGGER.isEnabledFor(logging.DEBUG)
         self._suffix_to_code_scanner_map: Mapping[str, CodeScanner] = {}
         for code_scanner in self._code_scanners:
             for file_suffix in code_scanner.get_file_suffixes():
@@ -75,6 +128,11 @@ class CodeScannerManager:
                         f"{file_suffix} in multiple code scanners"
                     )
                 self._suffix_to_code_scanner_map[file_suffix] = code_scanner
+        # Bare suffixes (no leading dot) for set-membership dispatch on plain
+        # DirEntry names during the walk.
+        self._bare_suffixes = frozenset(
+            suffix.lstrip(".") for suffix in self._suffix_to_code_scanner_map
+        )
 
     @property
     def cache(self) -> CodeScannerCache:
@@ -85,6 +143,7 @@ class CodeScannerManager:
         cls,
         strings: Container[Literal["python"]],
         cache: CodeScannerCache | None = None,
+        jobs: int | None = None,
     ) -> Self:
         code_scanners: list[CodeScanner] = []
         if "python" in strings:
@@ -92,54 +151,95 @@ class CodeScannerManager:
         return cls(
             code_scanners=code_scanners,
             cache=cache,
+            jobs=jobs,
         )
 
-    def _scan_file_using_code_scanners(
-        self, path: Path
-    ) -> Generator[Workaround, None, None]:
-        LOGGER.debug("Scanning %s", path)
-        found_workarounds: list[Workaround] = []
-        with path.open() as file_to_scan:
-            code_scanner = self._suffix_to_code_scanner_map[path.suffix]
-            LOGGER.debug("Using %s on %s", code_scanner, path)
-            for line_number, url in code_scanner.scan_file(file_to_scan):
-                LOGGER.debug(
-                    "%s found a workaround on line %s", code_scanner, line_number
-                )
-                workaround = Workaround(
-                    file=path,
-                    line=line_number,
-                    url=url,
-                )
-                yield workaround
-                found_workarounds.append(workaround)
+    def _record_scan_result(
+        self,
+        path: Path,
+        found: list[tuple[int, str]],
+        timestamp: float,
+    ) -> list[WorkaroundData]:
+        workarounds = [
+            WorkaroundData(file=path, line=line_number, url=url)
+            for line_number, url in found
+        ]
+        # Only the cache write path constructs the Pydantic models.
         self._cache.files[path] = FileScanCache(
-            workarounds=found_workarounds,
-            timestamp=time.time(),
+            workarounds=[
+                Workaround(
+                    file=workaround.file, line=workaround.line, url=workaround.url
+                )
+                for workaround in workarounds
+            ],
+            timestamp=timestamp,
         )
+        return workarounds
 
-    def _scan_file(self, path: Path) -> Generator[Workaround, None, None]:
-        LOGGER.debug("Processing %s", path)
-        file_scan_cache: FileScanCache | None = self._cache.files.get(path)
-        if file_scan_cache is not None:
-            last_modified_time: float = path.stat().st_mtime
-            last_checked_time: float = file_scan_cache.timestamp
-            if last_checked_time < last_modified_time:
-                yield from self._scan_file_using_code_scanners(path)
-            else:
-                yield from file_scan_cache.workarounds
+    def _scan_files(self, paths: list[Path]) -> dict[Path, list[WorkaroundData]]:
+        code_scanners = []
+        for path in paths:
+            if self._log_debug:
+                LOGGER.debug("Scanning %s", path)
+            code_scanner = self._suffix_to_code_scanner_map[path.suffix]
+            if self._log_debug:
+                LOGGER.debug("Using %s on %s", code_scanner, path)
+            code_scanners.append(code_scanner)
+        if len(paths) < PARALLEL_SCAN_MIN_FILES or self._jobs == 1:
+            scan_results = list(map(_scan_file_worker, code_scanners, paths))
         else:
-            yield from self._scan_file_using_code_scanners(path)
-
-    def scan_path(self, path: Path) -> Generator[Workaround, None, None]:
-        LOGGER.debug("Globing %s recursively", path)
-        for file in path.rglob("**/*"):
-            LOGGER.debug("Examining %s", file)
-            if not file.is_file():
-                LOGGER.debug("Not a file - skipping")
-                continue
-            LOGGER.debug("%s is a file", file)
-            if file.suffix in self._suffix_to_code_scanner_map:
-                LOGGER.debug("File suffix %s matches - scan file", file.suffix)
-                yield from self._scan_file(file)
+            # Each file is independent, so split them across worker
+            # processes to sidestep the GIL.
+            with ProcessPoolExecutor(max_workers=self._jobs) as executor:
+                scan_results = list(
+                    executor.map(_scan_file_worker, code_scanners, paths)
+                )
+        return {
+            path: self._record_scan_result(path, found, timestamp)
+            for path, (found, timestamp) in zip(paths, scan_results)
+        }
+
+    def scan_path(self, path: Path) -> Generator[WorkaroundData, None, None]:
+        LOGGER.debug("Walking %s recursively", path)
+        if not path.is_dir():
+            LOGGER.debug("%s is not a directory - done", path)
+            return
+        bare_suffixes = self._bare_suffixes
+        # Walk with os.scandir instead of rglob: DirEntry answers is_dir and
+        # is_file from the cached dirent, avoiding one stat per entry, and
+        # the suffix check runs on plain names before any Path is built.
+        matching_files: list[tuple[Path, float]] = []
+        directories = [os.fspath(path)]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                        continue
+                    _, dot, suffix = entry.name.rpartition(".")
+                    if (
+                        dot
+                        and suffix in bare_suffixes
+                        and entry.is_file(follow_symlinks=False)
+                    ):
+                        if self._log_debug:
+                            LOGGER.debug("File suffix matches - scan %s", entry.path)
+                        # Reuse the stat result from the directory walk so the
+                        # cache-hit path does not stat the file a second time.
+                        matching_files.append((Path(entry.path), entry.stat().st_mtime))
+        files_to_scan = [
+            file
+            for file, last_modified_time in matching_files
+            if (file_scan_cache := self._cache.files.get(file)) is None
+            or file_scan_cache.timestamp < last_modified_time
+        ]
+        scanned = self._scan_files(files_to_scan)
+        for file, _ in matching_files:
+            if file in scanned:
+                yield from scanned[file]
+            else:
+                for cached in self._cache.files[file].workarounds:
+                    yield WorkaroundData(
+                        file=cached.file, line=cached.line, url=cached.url
+                    )
         LOGGER.debug("Done scanning %s", path)
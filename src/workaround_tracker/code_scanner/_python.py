@@ -1,12 +1,24 @@
+import bisect
 import logging
+import re
 import typing
 
 from workaround_tracker.common import WORKAROUND_COMMENT_PREFIX
 
-from ._base import CodeScanner, find_first_url_in_text
+from ._base import CodeScanner
 
 LOGGER = logging.getLogger(__name__)
 
+# Matches a workaround comment line and captures its issue url in a single
+# pass, replacing the separate prefix check and url search. The whitespace
+# classes must not match newlines, or a match could start on an earlier
+# blank line's ^ anchor and mis-report the line number.
+_WORKAROUND_URL_REGEX = re.compile(
+    rf"^[^\S\n]*#[^\S\n]*{re.escape(WORKAROUND_COMMENT_PREFIX)}.*?(https?://\S+)",
+    re.MULTILINE,
+)
+_NEWLINE_REGEX = re.compile(r"\n")
+
 
 class PythonCodeScanner(CodeScanner):
     def get_file_suffixes(self) -> set[str]:
@@ -15,11 +27,13 @@ class PythonCodeScanner(CodeScanner):
     def scan_file(
         self, file: typing.IO[str]
     ) -> typing.Generator[tuple[int, str], None, None]:
-        for line_index, line in enumerate(file.readlines()):
-            line_number = line_index + 1
-            if line.lstrip().startswith(f"# {WORKAROUND_COMMENT_PREFIX}"):
-                LOGGER.debug("Found workaround on L%s", line_number)
-                url: typing.Optional[str] = find_first_url_in_text(line)
-                if url is not None:
-                    LOGGER.debug("Found url: %s", url)
-                    yield line_number, url
+        # Read the whole file and let the regex engine walk it in C instead
+        # of dispatching the pattern per line in Python.
+        content = file.read()
+        if WORKAROUND_COMMENT_PREFIX not in content:
+            return
+        newline_offsets = [match.start() for match in _NEWLINE_REGEX.finditer(content)]
+        for match in _WORKAROUND_URL_REGEX.finditer(content):
+            line_number = bisect.bisect_right(newline_offsets, match.start()) + 1
+            LOGGER.debug("Found workaround on L%s", line_number)
+            yield line_number, match.group(1)
@@ -1,14 +1,16 @@
-import sys
+import functools
 from pathlib import Path, PurePath
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, Literal, NamedTuple
 
 import pydantic
 import yaml
 
-if sys.version_info >= (3, 11):  # pragma: no cover
-    from typing import Self
-else:  # pragma: no cover
-    from typing_extensions import Self
+try:  # pragma: no cover
+    # The C loader parses config an order of magnitude faster, but PyYAML
+    # is not always built against libyaml.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 WORKAROUND_COMMENT_PREFIX = "WORKAROUND"
 CACHE_FILE_NAME = ".workaround-tracker-cache.json"
@@ -42,15 +44,37 @@ class Workaround(pydantic.BaseModel):
     url: str
 
 
+class WorkaroundData(NamedTuple):
+    """A workaround in the code, as passed around in memory.
+
+    Cheaper to construct than the :class:`Workaround` model, which is only
+    needed at the cache serialization boundary.
+
+    Attributes:
+        file: The path to the file.
+        line: The line number.
+        url: The url to the issue the workaround is for.
+
+    """
+
+    file: Path
+    line: int
+    url: str
+
+
 class AuthenticationConfig(pydantic.BaseModel):
     """Configuration for authentication to an issue tracker."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     env: str
 
 
 class IssueTrackerConfig(pydantic.BaseModel):
     """Configuration for a single issue tracker, e.g., a github instance."""
 
+    model_config = pydantic.ConfigDict(frozen=True)
+
     kind: Literal["github", "gitlab"]
     host: str = pydantic.Field(pattern=r"[^/]+")
     authentication: AuthenticationConfig
@@ -70,15 +94,27 @@ class IssueTrackerConfig(pydantic.BaseModel):
 class Config(pydantic.BaseModel):
     """The main configuration of workaround-tracker."""
 
+    # Frozen keeps loaded configuration immutable, so the memoized loader
+    # can hand the same instance to every caller safely.
+    model_config = pydantic.ConfigDict(frozen=True)
+
     scanners: list[Literal["python"]] = pydantic.Field(default=["python"])
     issue_trackers: list[IssueTrackerConfig] = pydantic.Field(default_factory=list)
 
     @classmethod
-    def _from_dict(cls: type[Self], d: dict[str, Any]) -> Self:
-        return cls.model_validate(d)
+    def from_yaml_file(cls, config_file: Path) -> "Config":
+        # Keyed on mtime as well, so an edited file is reparsed while
+        # repeated loads of an unchanged file hit the memo.
+        return _config_from_yaml_file(config_file, config_file.stat().st_mtime_ns)
 
-    @classmethod
-    def from_yaml_file(cls: type[Self], config_file: Path) -> Self:
-        with config_file.open() as config_filehandle:
-            config_content = yaml.safe_load(config_filehandle)
-        return cls._from_dict(config_content)
+
+# Compiled once at import so every validation reuses the same pydantic-core
+# validator instead of setting one up per call.
+_CONFIG_ADAPTER = pydantic.TypeAdapter(Config)
+
+
+@functools.lru_cache
+def _config_from_yaml_file(config_file: Path, _last_modified_time: int) -> Config:
+    with config_file.open() as config_filehandle:
+        config_content = yaml.load(config_filehandle, Loader=SafeLoader)
+    return _CONFIG_ADAPTER.validate_python(config_content)
@@ -1,5 +1,11 @@
-from ._manager import IssueCheckerManager
+from ._manager import (
+    UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
+    IssueCheckerManager,
+    IssueResolutionCache,
+)
 
 __all__ = [
+    "UNRESOLVED_ISSUE_CACHE_TTL_SECONDS",
     "IssueCheckerManager",
+    "IssueResolutionCache",
 ]
@@ -1,8 +1,15 @@
 import abc
 import typing
 
+CONNECTION_POOL_SIZE = 16
+
 
 class IssueChecker(abc.ABC):
+    # The netloc of issue urls this checker can handle, when fixed to one
+    # host; the manager dispatches urls on it. None means the checker has to
+    # be probed with is_issue_resolved.
+    netloc: typing.Optional[str] = None
+
     @abc.abstractmethod
     def is_issue_resolved(
         self, url: str
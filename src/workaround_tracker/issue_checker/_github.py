@@ -3,40 +3,62 @@ from __future__ import annotations
 import atexit
 import functools
 import logging
+import re
 import urllib.parse
 from typing import TYPE_CHECKING
 
 import requests
 
 if TYPE_CHECKING:  # pragma: no cover
-    import sys
+    from collections.abc import Iterable
 
-    if sys.version_info >= (3, 11):
-        pass
-    else:
-        pass
+from workaround_tracker.common import WorkaroundTrackerError
 
-from ._base import IssueChecker
+from ._base import CONNECTION_POOL_SIZE, IssueChecker
 
 LOGGER = logging.getLogger(__name__)
 
 GITHUB_MEDIA_TYPE = "application/vnd.github+json"
 
+# Compiled once at import; a single pass validates the url and captures
+# every component the API calls need. Workaround comments often link to a
+# specific comment, so a query string or fragment tail is allowed.
+_ISSUE_URL_REGEX = re.compile(
+    r"https?://(?P<netloc>[^/]+)/(?P<owner>[^/]+)/(?P<repository>[^/]+)"
+    r"/issues/(?P<number>\d+)/?(?:[?#]\S*)?$"
+)
+
+
+class GithubGraphQLError(WorkaroundTrackerError):
+    """Raised when the Github GraphQL API reports errors instead of data."""
+
 
 class GithubIssueChecker(IssueChecker):
     def __init__(self, url: str, token: str) -> None:
         split_result = urllib.parse.urlsplit(url)
         self._scheme = split_result.scheme
-        self._netloc = split_result.netloc
+        self.netloc = split_result.netloc
         self._token = token
 
     @functools.cached_property
     def _session(self) -> requests.Session:
         session = requests.Session()
-        session.headers = {
-            "Accept": GITHUB_MEDIA_TYPE,
-            "Bearer": self._token,
-        }
+        # update() keeps the session defaults (keep-alive, gzip) that a
+        # plain dict assignment would discard.
+        session.headers.update(
+            {
+                "Accept": GITHUB_MEDIA_TYPE,
+                "Bearer": self._token,
+            }
+        )
+        # Size the connection pool for the manager's concurrent checks so
+        # parallel requests reuse warm TCP+TLS connections.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         atexit.register(session.close)
         return session
 
@@ -45,24 +67,89 @@ class GithubIssueChecker(IssueChecker):
             "Checking if the url %s is a Github URL that this IssueChecker can handle",
             url,
         )
-        split_result = urllib.parse.urlsplit(url)
+        match = _ISSUE_URL_REGEX.match(url)
 
-        if split_result.netloc != self._netloc:
-            LOGGER.debug("... it is not (%s != %s)", split_result.netloc, self._netloc)
+        if match is None or match["netloc"] != self.netloc:
+            LOGGER.debug("... it is not a %s issue url", self.netloc)
             return None
 
         LOGGER.debug("URL %s has a matching netloc - will query Github", url)
         response = self._session.get(
-            url=urllib.parse.urlunsplit(
-                (
-                    self._scheme,
-                    f"api.{split_result.netloc}",
-                    f"/repos{split_result.path}",
-                    None,
-                    None,
-                )
-            ),
+            url=f"{self._scheme}://api.{self.netloc}/repos/"
+            f"{match['owner']}/{match['repository']}/issues/{match['number']}",
         )
         response.raise_for_status()
         is_closed: bool = response.json()["state"] == "closed"
         return is_closed
+
+    def resolve_many(self, urls: Iterable[str]) -> dict[str, bool | None]:
+        """Resolve many issue urls with a single GraphQL request.
+
+        Args:
+            urls: The issue urls to resolve.
+
+        Returns:
+            A mapping from url to whether the issue is resolved, with None
+            for urls this IssueChecker cannot handle.
+
+        """
+        results: dict[str, bool | None] = {}
+        issue_aliases: dict[str, tuple[tuple[str, str], str]] = {}
+        repository_fields: dict[tuple[str, str], list[str]] = {}
+        for url in urls:
+            match = _ISSUE_URL_REGEX.match(url)
+            if match is None or match["netloc"] != self.netloc:
+                results[url] = None
+                continue
+            repository_key = (match["owner"], match["repository"])
+            fields = repository_fields.setdefault(repository_key, [])
+            issue_alias = f"i{len(issue_aliases)}"
+            issue_aliases[url] = (repository_key, issue_alias)
+            fields.append(
+                f"{issue_alias}: issue(number: {match['number']}) {{ state }}"
+            )
+        if not issue_aliases:
+            return results
+        repository_aliases = {
+            repository_key: f"r{index}"
+            for index, repository_key in enumerate(repository_fields)
+        }
+        # owner and repository come from arbitrary urls, so they are passed
+        # as GraphQL variables instead of being interpolated into the query
+        # document.
+        variables: dict[str, str] = {}
+        declarations: list[str] = []
+        repository_queries: list[str] = []
+        for (owner, repository), fields in repository_fields.items():
+            alias = repository_aliases[(owner, repository)]
+            variables[f"owner_{alias}"] = owner
+            variables[f"name_{alias}"] = repository
+            declarations.append(f"$owner_{alias}: String!, $name_{alias}: String!")
+            repository_queries.append(
+                f"{alias}: repository(owner: $owner_{alias}, name: $name_{alias})"
+                f' {{ {" ".join(fields)} }}'
+            )
+        query = (
+            f'query ({", ".join(declarations)})'
+            f' {{ {" ".join(repository_queries)} }}'
+        )
+        LOGGER.debug("Resolving %s issue urls in one GraphQL query", len(issue_aliases))
+        response = self._session.post(
+            url=f"{self._scheme}://api.{self.netloc}/graphql",
+            json={"query": query, "variables": variables},
+        )
+        response.raise_for_status()
+        payload = response.json()
+        data = payload.get("data")
+        if data is None:
+            # GraphQL-level failures come back as HTTP 200 with an "errors"
+            # list and no data.
+            raise GithubGraphQLError(
+                f"Github GraphQL query failed: {payload.get('errors')}"
+            )
+        for url, (repository_key, issue_alias) in issue_aliases.items():
+            issue = (data.get(repository_aliases[repository_key]) or {}).get(
+                issue_alias
+            )
+            results[url] = issue["state"] == "CLOSED" if issue is not None else None
+        return results
@@ -3,37 +3,59 @@ from __future__ import annotations
 import atexit
 import functools
 import logging
+import re
 import urllib.parse
 from typing import TYPE_CHECKING
 
 import requests
 
 if TYPE_CHECKING:  # pragma: no cover
-    import sys
+    from collections.abc import Iterable
 
-    if sys.version_info >= (3, 11):
-        pass
-    else:
-        pass
-
-from ._base import IssueChecker
+from ._base import CONNECTION_POOL_SIZE, IssueChecker
 
 LOGGER = logging.getLogger(__name__)
 
+# Gitlab returns 20 results per page by default and caps per_page at 100;
+# batching the iids at that cap keeps every bulk request single-page.
+MAX_ISSUES_PER_REQUEST = 100
+
+# Compiled once at import; a single pass validates the url and captures
+# every component the API calls need. Gitlab project paths can be nested,
+# and the web ui sometimes inserts "/-" before "/issues". Workaround
+# comments often link to a specific note, so a query string or fragment
+# tail is allowed.
+_ISSUE_URL_REGEX = re.compile(
+    r"https?://(?P<netloc>[^/]+)/(?P<project>.+?)(?:/-)?"
+    r"/issues/(?P<number>\d+)/?(?:[?#]\S*)?$"
+)
+
 
 class GitlabIssueChecker(IssueChecker):
     def __init__(self, url: str, token: str) -> None:
         split_result = urllib.parse.urlsplit(url)
         self._scheme = split_result.scheme
-        self._netloc = split_result.netloc
+        self.netloc = split_result.netloc
         self._token = token
 
     @functools.cached_property
     def _session(self) -> requests.Session:
         session = requests.Session()
-        session.headers = {
-            "PRIVATE-TOKEN": self._token,
-        }
+        # update() keeps the session defaults (keep-alive, gzip) that a
+        # plain dict assignment would discard.
+        session.headers.update(
+            {
+                "PRIVATE-TOKEN": self._token,
+            }
+        )
+        # Size the connection pool for the manager's concurrent checks so
+        # parallel requests reuse warm TCP+TLS connections.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         atexit.register(session.close)
         return session
 
@@ -42,28 +64,66 @@ class GitlabIssueChecker(IssueChecker):
             "Checking if the url %s is a Gitlab URL that this IssueChecker can handle",
             url,
         )
-        split_result = urllib.parse.urlsplit(url)
+        match = _ISSUE_URL_REGEX.match(url)
 
-        if split_result.netloc != self._netloc:
-            LOGGER.debug("... it is not (%s != %s)", split_result.netloc, self._netloc)
+        if match is None or match["netloc"] != self.netloc:
+            LOGGER.debug("... it is not a %s issue url", self.netloc)
             return None
 
         LOGGER.debug("URL %s has a matching netloc - will query Gitlab", url)
-        project_path, issue_id = split_result.path.replace(
-            "/-/issues", "/issues"
-        ).rsplit("/issues/", 1)
-        encoded_project_path = urllib.parse.quote(project_path.lstrip("/"), safe="")
+        encoded_project_path = urllib.parse.quote(match["project"], safe="")
         response = self._session.get(
-            url=urllib.parse.urlunsplit(
-                (
-                    self._scheme,
-                    split_result.netloc,
-                    f"/api/v4/projects/{encoded_project_path}/issues/{issue_id}",
-                    None,
-                    None,
-                )
-            ),
+            url=f"{self._scheme}://{self.netloc}"
+            f"/api/v4/projects/{encoded_project_path}/issues/{match['number']}",
         )
         response.raise_for_status()
         is_closed: bool = response.json()["state"] == "closed"
         return is_closed
+
+    def resolve_many(self, urls: Iterable[str]) -> dict[str, bool | None]:
+        """Resolve many issue urls with one request per project.
+
+        Args:
+            urls: The issue urls to resolve.
+
+        Returns:
+            A mapping from url to whether the issue is resolved, with None
+            for urls this IssueChecker cannot handle.
+
+        """
+        results: dict[str, bool | None] = {}
+        urls_by_project: dict[str, dict[str, str]] = {}
+        for url in urls:
+            match = _ISSUE_URL_REGEX.match(url)
+            if match is None or match["netloc"] != self.netloc:
+                results[url] = None
+                continue
+            urls_by_project.setdefault(match["project"], {})[match["number"]] = url
+        for project_path, issue_urls in urls_by_project.items():
+            encoded_project_path = urllib.parse.quote(project_path, safe="")
+            LOGGER.debug(
+                "Resolving %s issues in %s in batches of up to %s",
+                len(issue_urls),
+                project_path,
+                MAX_ISSUES_PER_REQUEST,
+            )
+            issue_ids = sorted(issue_urls)
+            states: dict[str, str] = {}
+            for start in range(0, len(issue_ids), MAX_ISSUES_PER_REQUEST):
+                params: dict[str, int | list[str]] = {
+                    "iids[]": issue_ids[start : start + MAX_ISSUES_PER_REQUEST],
+                    "per_page": MAX_ISSUES_PER_REQUEST,
+                }
+                response = self._session.get(
+                    url=f"{self._scheme}://{self.netloc}"
+                    f"/api/v4/projects/{encoded_project_path}/issues",
+                    params=params,
+                )
+                response.raise_for_status()
+                states.update(
+                    (str(issue["iid"]), issue["state"]) for issue in response.json()
+                )
+            for issue_id, url in issue_urls.items():
+                state = states.get(issue_id)
+                results[url] = state == "closed" if state is not None else None
+        return results
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import functools
+import itertools
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -10,10 +13,13 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 import cachetools
+import orjson
+import pydantic
 from cachetools.keys import hashkey
 
 if TYPE_CHECKING:  # pragma: no cover
     import sys
+    from pathlib import Path
 
     from ._base import IssueChecker
 
@@ -24,7 +30,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 from workaround_tracker.common import (
     IssueTrackerConfig,
-    Workaround,
+    WorkaroundData,
     WorkaroundTrackerError,
 )
 
@@ -33,24 +39,100 @@ from ._gitlab import GitlabIssueChecker
 
 LOGGER = logging.getLogger(__name__)
 
+# Default worker count for per-url checks; override with WT_HTTP_CONCURRENCY
+# to match a tracker's rate limits.
+MAX_CONCURRENT_ISSUE_CHECKS = 16
+# Resolved issues stay resolved, so they are cached forever; unresolved
+# issues are re-checked once their cache entry is this old.
+UNRESOLVED_ISSUE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
 
 class UnknownIssueResolutionError(WorkaroundTrackerError):
     """Known when there is no way to determine if an issue is resolved."""
 
 
+class IssueResolution(pydantic.BaseModel):
+    is_resolved: bool
+    timestamp: float
+
+
+class IssueResolutionCache(pydantic.BaseModel):
+    """On-disk cache of issue resolution state across runs."""
+
+    urls: dict[str, IssueResolution] = pydantic.Field(default_factory=dict)
+
+    @classmethod
+    def from_json_file(cls: type[Self], cache_file: Path) -> Self:
+        with cache_file.open(mode="rb") as cache_filehandle:
+            cache_content = orjson.loads(cache_filehandle.read())
+        # Written by our own serializer, so skip revalidation.
+        return cls.model_construct(
+            urls={
+                url: IssueResolution.model_construct(**resolution)
+                for url, resolution in cache_content["urls"].items()
+            }
+        )
+
+    def write_to_json_file(self, cache_file: Path) -> None:
+        cache_file.write_bytes(orjson.dumps(self.model_dump(mode="json")))
+
+    def get(self, url: str, now: float, unresolved_ttl: float) -> bool | None:
+        """Look up a cached resolution, treating stale unresolved entries as misses."""
+        resolution = self.urls.get(url)
+        if resolution is None:
+            return None
+        if resolution.is_resolved or now - resolution.timestamp < unresolved_ttl:
+            return resolution.is_resolved
+        return None
+
+    def put(self, url: str, *, is_resolved: bool, now: float) -> None:
+        """Record the resolution of a url."""
+        self.urls[url] = IssueResolution(is_resolved=is_resolved, timestamp=now)
+
+
 def _workaround_url_hash_key(
-    _: IssueCheckerManager, workaround: Workaround, method: str
+    _: IssueCheckerManager, workaround: WorkaroundData, method: str
 ) -> tuple:  # type: ignore[type-arg]
     return hashkey(workaround.url, method)
 
 
 class IssueCheckerManager:
-    def __init__(self, issue_checkers: Iterable[IssueChecker]) -> None:
+    def __init__(
+        self,
+        issue_checkers: Iterable[IssueChecker],
+        resolution_cache: IssueResolutionCache | None = None,
+        unresolved_ttl: float = UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
+    ) -> None:
         self._issue_checkers = list(issue_checkers)
-        self._runtime_cache = cachetools.LRUCache(maxsize=64)  # type: ignore[var-annotated]
+        # Checkers that declare a netloc are dispatched to directly by the
+        # netloc of the url being checked; the rest are tried in order.
+        self._netloc_to_issue_checkers: dict[str, list[IssueChecker]] = {}
+        self._fallback_issue_checkers: list[IssueChecker] = []
+        for issue_checker in self._issue_checkers:
+            netloc = issue_checker.netloc
+            if netloc is None:
+                self._fallback_issue_checkers.append(issue_checker)
+            else:
+                self._netloc_to_issue_checkers.setdefault(netloc, []).append(
+                    issue_checker
+                )
+        self._resolution_cache = resolution_cache or IssueResolutionCache()
+        self._unresolved_ttl = unresolved_ttl
+        # Unbounded on purpose: the set of urls seen in one run is naturally
+        # bounded and the cache dies with the process.
+        self._runtime_cache: dict = {}  # type: ignore[type-arg]
+
+    @property
+    def resolution_cache(self) -> IssueResolutionCache:
+        return self._resolution_cache
 
     @classmethod
-    def from_config(cls: type[Self], configs: Iterable[IssueTrackerConfig]) -> Self:
+    def from_config(
+        cls: type[Self],
+        configs: Iterable[IssueTrackerConfig],
+        resolution_cache: IssueResolutionCache | None = None,
+        unresolved_ttl: float = UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
+    ) -> Self:
         issue_checkers: list[IssueChecker] = []
         for config in configs:
             token = os.environ[config.authentication.env]
@@ -71,7 +153,77 @@ class IssueCheckerManager:
             else:  # pragma: no cover
                 # Should be prevented by configuration validation
                 raise AssertionError("Unknown issue tracker kind: %s", config.kind)
-        return cls(issue_checkers=issue_checkers)
+        return cls(
+            issue_checkers=issue_checkers,
+            resolution_cache=resolution_cache,
+            unresolved_ttl=unresolved_ttl,
+        )
+
+    def are_workarounds_redundant(
+        self, workarounds: Iterable[WorkaroundData]
+    ) -> dict[str, bool]:
+        """Check many workarounds at once, keyed by their issue urls.
+
+        Issue checkers that support it resolve their urls in bulk; the rest
+        are checked one url at a time on a thread pool.
+
+        Args:
+            workarounds: The workarounds to check.
+
+        Returns:
+            A mapping from issue url to whether the workaround is redundant.
+
+        """
+        unique_workarounds: dict[str, WorkaroundData] = {}
+        for workaround in workarounds:
+            unique_workarounds.setdefault(workaround.url, workaround)
+        results: dict[str, bool] = {}
+        now = time.time()
+        remaining: dict[str, WorkaroundData] = {}
+        for url, workaround in unique_workarounds.items():
+            cached_resolution = self._resolution_cache.get(
+                url, now, self._unresolved_ttl
+            )
+            if cached_resolution is not None:
+                LOGGER.debug("Resolution of %s found in the on-disk cache", url)
+                results[url] = cached_resolution
+            else:
+                remaining[url] = workaround
+        checked_urls = list(remaining)
+        for issue_checker in self._issue_checkers:
+            if not remaining:
+                break
+            resolve_many = getattr(issue_checker, "resolve_many", None)
+            if resolve_many is None:
+                continue
+            LOGGER.debug(
+                "Bulk-resolving %s urls with %s", len(remaining), issue_checker
+            )
+            resolved = resolve_many(list(remaining))
+            still_remaining: dict[str, WorkaroundData] = {}
+            for url, workaround in remaining.items():
+                is_resolved = resolved.get(url)
+                if is_resolved is None:
+                    still_remaining[url] = workaround
+                else:
+                    results[url] = is_resolved
+            remaining = still_remaining
+        if remaining:
+            # The remaining checks are network-latency-bound, so overlap
+            # them across threads.
+            max_workers = int(
+                os.environ.get("WT_HTTP_CONCURRENCY", MAX_CONCURRENT_ISSUE_CHECKS)
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results.update(
+                    zip(
+                        remaining,
+                        executor.map(self.is_workaround_redundant, remaining.values()),
+                    )
+                )
+        for url in checked_urls:
+            self._resolution_cache.put(url, is_resolved=results[url], now=now)
+        return results
 
     @cachetools.cachedmethod(
         lambda self: self._runtime_cache,
@@ -79,13 +231,19 @@ class IssueCheckerManager:
             _workaround_url_hash_key, method="is_workaround_redundant"
         ),
     )
-    def is_workaround_redundant(self, workaround: Workaround) -> bool:
+    def is_workaround_redundant(self, workaround: WorkaroundData) -> bool:
         LOGGER.debug(
             "Checking if the workaround in %s at L%s is resolved",
             workaround.file,
             workaround.line,
         )
-        for issue_checker in self._issue_checkers:
+        _, _, remainder = workaround.url.partition("://")
+        netloc, _, _ = remainder.partition("/")
+        issue_checkers = itertools.chain(
+            self._netloc_to_issue_checkers.get(netloc, ()),
+            self._fallback_issue_checkers,
+        )
+        for issue_checker in issue_checkers:
             is_resolved: bool | None = issue_checker.is_issue_resolved(workaround.url)
             if is_resolved is not None:
                 LOGGER.debug("%s resolved: %s", workaround.url, is_resolved)
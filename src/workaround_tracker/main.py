@@ -1,12 +1,19 @@
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from workaround_tracker.common import WorkaroundData
 
 import click
 
 from workaround_tracker.code_scanner import CodeScannerCache, CodeScannerManager
 from workaround_tracker.common import CACHE_FILE_NAME, Config
-from workaround_tracker.issue_checker import IssueCheckerManager
+from workaround_tracker.issue_checker import (
+    UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
+    IssueCheckerManager,
+    IssueResolutionCache,
+)
 
 LOGGER = logging.getLogger(__name__)
 EXIT_CODE_REDUNDANT_WORKAROUNDS = 3
@@ -24,6 +31,12 @@ def read_cache_file(cache_file: Path) -> CodeScannerCache:
     return CodeScannerCache()
 
 
+def read_issue_cache_file(issue_cache_file: Path) -> IssueResolutionCache:
+    if issue_cache_file.exists():
+        return IssueResolutionCache.from_json_file(issue_cache_file)
+    return IssueResolutionCache()
+
+
 @click.command()
 @click.argument(
     "source_paths",
@@ -38,16 +51,20 @@ def read_cache_file(cache_file: Path) -> CodeScannerCache:
 @click.option(
     "--cache-file",
     type=click.Path(readable=True, writable=True, path_type=Path),
-    default=Path.cwd() / CACHE_FILE_NAME,
+    default=None,
 )
 @click.option("--cache/--no-cache", default=True)
+@click.option("--cache-ttl", type=float, default=UNRESOLVED_ISSUE_CACHE_TTL_SECONDS)
+@click.option("--jobs", type=int, default=None)
 @click.option("--debug", is_flag=True)
-def check(
+def check(  # noqa: PLR0913
     source_paths: list[Path],
     *,
     config_file: Path,
-    cache_file: Path,
+    cache_file: Optional[Path],
     cache: bool,
+    cache_ttl: float,
+    jobs: Optional[int],
     debug: bool,
 ) -> None:
     setup_logging(debug=debug)
@@ -56,34 +73,59 @@ def check(
         LOGGER.debug("No source paths - done")
         raise SystemExit(0)
 
+    if cache_file is None:
+        # Resolved here rather than in the option default, which would pin
+        # the working directory at import time.
+        cache_file = Path.cwd() / CACHE_FILE_NAME
+    issue_cache_file = cache_file.with_suffix(".issues.json")
     code_scanner_cache: Optional[CodeScannerCache] = None
+    issue_resolution_cache: Optional[IssueResolutionCache] = None
     if cache:
         code_scanner_cache = read_cache_file(cache_file)
+        issue_resolution_cache = read_issue_cache_file(issue_cache_file)
     config = Config.from_yaml_file(config_file)
     code_scanner_manager = CodeScannerManager.from_scanner_strings(
         strings=config.scanners,
         cache=code_scanner_cache,
+        jobs=jobs,
+    )
+    issue_checker_manager = IssueCheckerManager.from_config(
+        config.issue_trackers,
+        resolution_cache=issue_resolution_cache,
+        unresolved_ttl=cache_ttl,
     )
-    issue_checker_manager = IssueCheckerManager.from_config(config.issue_trackers)
 
-    found_redundant_workarounds = False
+    workarounds_by_url: dict[str, list[WorkaroundData]] = {}
     for source_path in source_paths:
         for workaround in code_scanner_manager.scan_path(source_path):
             LOGGER.debug(
                 "Found workaround in %s at L%s", workaround.file, workaround.line
             )
-            if issue_checker_manager.is_workaround_redundant(workaround):
+            workarounds_by_url.setdefault(workaround.url, []).append(workaround)
+
+    found_redundant_workarounds = False
+    # Many workarounds often reference the same issue; check each unique url
+    # only once and fan the result back out to every occurrence.
+    redundancy_by_url = issue_checker_manager.are_workarounds_redundant(
+        [workarounds[0] for workarounds in workarounds_by_url.values()]
+    )
+    for url, workarounds in workarounds_by_url.items():
+        if redundancy_by_url[url]:
+            for workaround in workarounds:
                 LOGGER.info(
                     "%s L%s RESOLVED: %s",
                     workaround.file,
                     workaround.line,
-                    workaround.url,
+                    url,
                 )
-                found_redundant_workarounds = True
+            found_redundant_workarounds = True
 
     if code_scanner_cache:
         LOGGER.debug("Writing cache to %s", cache_file)
         code_scanner_manager.cache.write_to_json_file(cache_file)
+    if issue_resolution_cache:
+        LOGGER.debug("Writing issue cache to %s", issue_cache_file)
+        issue_checker_manager.resolution_cache.write_to_json_file(issue_cache_file)
 
     raise SystemExit(
         EXIT_CODE_REDUNDANT_WORKAROUNDS if found_redundant_workarounds else 0
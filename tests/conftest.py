@@ -1,4 +1,8 @@
+from collections.abc import Generator
+
 import pytest
+import requests_mock as requests_mock_library
+from click.testing import CliRunner
 
 from workaround_tracker.main import setup_logging
 
@@ -6,3 +10,31 @@ from workaround_tracker.main import setup_logging
 @pytest.fixture(autouse=True, scope="session")
 def _debug_logging() -> None:
     setup_logging(debug=True)
+
+
+@pytest.fixture(scope="session")
+def requests_mock_session() -> Generator[requests_mock_library.Mocker, None, None]:
+    with requests_mock_library.Mocker() as mocker:
+        yield mocker
+
+
+@pytest.fixture
+def requests_mock(
+    requests_mock_session: requests_mock_library.Mocker,
+) -> Generator[requests_mock_library.Mocker, None, None]:
+    # Overrides the requests_mock plugin fixture: one session-wide Mocker
+    # patches requests once. reset_mock() only clears request history and
+    # matcher call counts, so the matcher list itself is snapshotted and
+    # restored to drop whatever the test registered.
+    adapter = requests_mock_session._adapter  # type: ignore[attr-defined]
+    matchers = list(adapter._matchers)
+    yield requests_mock_session
+    requests_mock_session.reset_mock()
+    adapter._matchers[:] = matchers
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    # The runner is stateless between invocations, so one instance serves
+    # the whole session.
+    return CliRunner()
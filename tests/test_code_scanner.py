@@ -2,7 +2,7 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import freezegun
 import pytest
@@ -16,7 +16,7 @@ from workaround_tracker.code_scanner._manager import (
     OverlappingCodeScannersError,
 )
 from workaround_tracker.code_scanner._python import PythonCodeScanner
-from workaround_tracker.common import Workaround
+from workaround_tracker.common import Workaround, WorkaroundData
 
 DATA_PATH = Path(__file__).parent / "data"
 CODE_PATH = DATA_PATH / "code"
@@ -37,19 +37,6 @@ def test_find_first_url_in_text(text: str, expected: Optional[str]) -> None:
     assert find_first_url_in_text(text) == expected
 
 
-@pytest.fixture
-def mock_find_first_url_in_text(monkeypatch: pytest.MonkeyPatch) -> Mock:
-    mocked_function = Mock(
-        spec=find_first_url_in_text,
-        side_effect=["http://first/url/1", None, "http://first/url/2"],
-    )
-    monkeypatch.setattr(
-        "workaround_tracker.code_scanner._python.find_first_url_in_text",
-        mocked_function,
-    )
-    return mocked_function
-
-
 @pytest.fixture
 def python_code_scanner() -> PythonCodeScanner:
     return PythonCodeScanner()
@@ -61,38 +48,66 @@ def test_python_file_suffixes(python_code_scanner: PythonCodeScanner) -> None:
 
 def test_python_scan_file(
     python_code_scanner: PythonCodeScanner,
-    mock_find_first_url_in_text: Mock,
     tmp_path: Path,
 ) -> None:
     file_to_scan = tmp_path / "file.py"
     with file_to_scan.open(mode="x") as filehandle:
         filehandle.write(
-            "".join(
-                [
-                    "\n",
-                    workaround_line_1 := "# WORKAROUND: for issue http://fake/url\n",
-                    workaround_line_2 := "# WORKAROUND: no url here\n",
-                    workaround_line_3
-                    := "# WORKAROUND: for issue http://other/fake/url\n",
-                    "\n",
-                ]
-            )
+            """
+# WORKAROUND: for issue http://fake/url
+# WORKAROUND: no url here
+# WORKAROUND: for issue http://other/fake/url
+do_something()  # not a WORKAROUND comment
+"""
         )
 
     with file_to_scan.open() as filehandle:
         workarounds = list(python_code_scanner.scan_file(filehandle))
 
-    assert mock_find_first_url_in_text.mock_calls == [
-        call(workaround_line_1),
-        call(workaround_line_2),
-        call(workaround_line_3),
+    assert workarounds == [
+        (2, "http://fake/url"),
+        (4, "http://other/fake/url"),
     ]
+
+
+def test_python_scan_file__blank_lines_before_comment(
+    python_code_scanner: PythonCodeScanner,
+    tmp_path: Path,
+) -> None:
+    # Consecutive blank and whitespace-only lines before a workaround
+    # comment must not shift the reported line number.
+    file_to_scan = tmp_path / "file.py"
+    file_to_scan.write_text(
+        "do_something()\n"
+        "\n"
+        "\n"
+        "# WORKAROUND: for issue http://fake/url\n"
+        "   \n"
+        "    # WORKAROUND: for issue http://other/fake/url\n"
+    )
+
+    with file_to_scan.open() as filehandle:
+        workarounds = list(python_code_scanner.scan_file(filehandle))
+
     assert workarounds == [
-        (2, "http://first/url/1"),
-        (4, "http://first/url/2"),
+        (4, "http://fake/url"),
+        (6, "http://other/fake/url"),
     ]
 
 
+def test_python_scan_file__no_workarounds(
+    python_code_scanner: PythonCodeScanner,
+    tmp_path: Path,
+) -> None:
+    file_to_scan = tmp_path / "file.py"
+    file_to_scan.write_text("def do_something() -> None:\n    pass\n")
+
+    with file_to_scan.open() as filehandle:
+        workarounds = list(python_code_scanner.scan_file(filehandle))
+
+    assert workarounds == []
+
+
 @pytest.fixture
 def mock_python_code_scanner() -> Mock:
     return Mock(
@@ -145,21 +160,53 @@ def test_code_scanner_manager__scan_path(mock_python_code_scanner: Mock) -> None
 
     assert mock_python_code_scanner.scan_file.call_count == 2
     assert workarounds == [
-        code_workaround := Workaround(file=PYTHON_FILE_IN_ROOT, line=1, url="hello"),
-        file_workaround := Workaround(file=PYTHON_FILE_IN_SUBDIR, line=2, url="world"),
+        WorkaroundData(file=PYTHON_FILE_IN_ROOT, line=1, url="hello"),
+        WorkaroundData(file=PYTHON_FILE_IN_SUBDIR, line=2, url="world"),
     ]
     assert manager.cache == CodeScannerCache(
         files={
             PYTHON_FILE_IN_ROOT: FileScanCache(
-                workarounds=[code_workaround], timestamp=1234.0
+                workarounds=[Workaround(file=PYTHON_FILE_IN_ROOT, line=1, url="hello")],
+                timestamp=1234.0,
             ),
             PYTHON_FILE_IN_SUBDIR: FileScanCache(
-                workarounds=[file_workaround], timestamp=1234.0
+                workarounds=[
+                    Workaround(file=PYTHON_FILE_IN_SUBDIR, line=2, url="world")
+                ],
+                timestamp=1234.0,
             ),
         }
     )
 
 
+def test_code_scanner_manager__scan_path__debug_logging_disabled(
+    monkeypatch: pytest.MonkeyPatch, mock_python_code_scanner: Mock
+) -> None:
+    monkeypatch.setattr(
+        "workaround_tracker.code_scanner._manager.LOGGER.isEnabledFor",
+        Mock(return_value=False),
+    )
+    manager = CodeScannerManager(code_scanners=[mock_python_code_scanner])
+
+    workarounds = list(manager.scan_path(CODE_PATH))
+
+    assert workarounds == [
+        WorkaroundData(file=PYTHON_FILE_IN_ROOT, line=1, url="hello"),
+        WorkaroundData(file=PYTHON_FILE_IN_SUBDIR, line=2, url="world"),
+    ]
+
+
+def test_code_scanner_manager__scan_path__not_a_directory(
+    mock_python_code_scanner: Mock,
+) -> None:
+    manager = CodeScannerManager(code_scanners=[mock_python_code_scanner])
+
+    workarounds = list(manager.scan_path(PYTHON_FILE_IN_ROOT))
+
+    mock_python_code_scanner.scan_file.assert_not_called()
+    assert workarounds == []
+
+
 def test_code_scanner_manager__scan_path__cached(
     mock_python_code_scanner: Mock,
 ) -> None:
@@ -189,8 +236,8 @@ def test_code_scanner_manager__scan_path__cached(
 
     assert mock_python_code_scanner.scan_file.call_count == 1
     assert workarounds == [
-        Workaround(file=PYTHON_FILE_IN_ROOT, line=1, url="hello"),
-        Workaround(file=PYTHON_FILE_IN_SUBDIR, line=2, url="world"),
+        WorkaroundData(file=PYTHON_FILE_IN_ROOT, line=1, url="hello"),
+        WorkaroundData(file=PYTHON_FILE_IN_SUBDIR, line=2, url="world"),
     ]
 
 
@@ -226,10 +273,12 @@ CACHE_1_CONTENT = CodeScannerCache()
         ("cache_1.json", CACHE_1_CONTENT),
     ],
 )
+@pytest.mark.parametrize("trusted", [True, False])
 def test_code_scanner_cache__from_json(
-    cache_file: str, expected: CodeScannerCache
+    cache_file: str, expected: CodeScannerCache, trusted: bool
 ) -> None:
-    assert CodeScannerCache.from_json_file(CACHE_PATH / cache_file) == expected
+    actual = CodeScannerCache.from_json_file(CACHE_PATH / cache_file, trusted=trusted)
+    assert actual == expected
 
 
 @pytest.mark.parametrize(
@@ -251,22 +300,63 @@ def test_code_scanner_cache__write_to_json_file(
         assert written_file.read() == matching_file.read()
 
 
+def test_code_scanner_manager__scan_path__parallel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "workaround_tracker.code_scanner._manager.PARALLEL_SCAN_MIN_FILES", 1
+    )
+    manager = CodeScannerManager(code_scanners=[PythonCodeScanner()], jobs=2)
+
+    workarounds = list(manager.scan_path(CODE_PATH))
+
+    assert [workaround.file for workaround in workarounds] == [
+        PYTHON_FILE_IN_ROOT,
+        PYTHON_FILE_IN_ROOT,
+        PYTHON_FILE_IN_SUBDIR,
+    ]
+
+
+def test_code_scanner_cache__round_trip(tmp_path: Path) -> None:
+    output_file = tmp_path / "cache.json"
+    CACHE_0_CONTENT.write_to_json_file(output_file)
+    assert CodeScannerCache.from_json_file(output_file) == CACHE_0_CONTENT
+
+
+def test_code_scanner_manager__scan_path__single_job(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "workaround_tracker.code_scanner._manager.PARALLEL_SCAN_MIN_FILES", 1
+    )
+    monkeypatch.setattr(
+        "workaround_tracker.code_scanner._manager.ProcessPoolExecutor",
+        mock_executor_cls := Mock(),
+    )
+    manager = CodeScannerManager(code_scanners=[PythonCodeScanner()], jobs=1)
+
+    workarounds = list(manager.scan_path(CODE_PATH))
+
+    mock_executor_cls.assert_not_called()
+    assert len(workarounds) == 3
+
+
 @pytest.mark.integration_test
 def test_code_scanner__integration() -> None:
     manager = CodeScannerManager(code_scanners=[PythonCodeScanner()])
     workarounds = list(manager.scan_path(CODE_PATH))
     assert workarounds == [
-        Workaround(
+        WorkaroundData(
             file=PYTHON_FILE_IN_ROOT,
             line=1,
             url="https://github.com/litestar-org/litestar/issues/3630",
         ),
-        Workaround(
+        WorkaroundData(
             file=PYTHON_FILE_IN_ROOT,
             line=5,
             url="https://gitlab.com/gitlab-org/gitlab-runner/-/issues/37983",
         ),
-        Workaround(
+        WorkaroundData(
             file=PYTHON_FILE_IN_SUBDIR,
             line=3,
             url="https://github.com/mam-dev/security-constraints/issues/32",
@@ -4,54 +4,66 @@ import pytest
 
 from workaround_tracker.common import AuthenticationConfig, Config, IssueTrackerConfig
 
+CONFIG_PATH = Path(__file__).parent / "data" / "config"
 
-@pytest.mark.parametrize(
-    "filename, expected",
-    [
-        (
-            "config_0.yaml",
-            Config(
-                scanners=["python"],
-                issue_trackers=[
-                    IssueTrackerConfig(
-                        kind="github",
-                        host="github.com",
-                        authentication=AuthenticationConfig(env="GITHUB_TOKEN"),
-                    ),
-                    IssueTrackerConfig(
-                        kind="github",
-                        host="local.github",
-                        authentication=AuthenticationConfig(env="LOCAL_GITHUB_TOKEN"),
-                    ),
-                    IssueTrackerConfig(
-                        kind="gitlab",
-                        host="gitlab.com",
-                        authentication=AuthenticationConfig(env="GITLAB_TOKEN"),
-                    ),
-                ],
+EXPECTED_CONFIGS = {
+    "config_0.yaml": Config(
+        scanners=["python"],
+        issue_trackers=[
+            IssueTrackerConfig(
+                kind="github",
+                host="github.com",
+                authentication=AuthenticationConfig(env="GITHUB_TOKEN"),
             ),
-        ),
-        (
-            "config_1.yaml",
-            Config(
-                scanners=["python"],
-                issue_trackers=[
-                    IssueTrackerConfig(
-                        kind="gitlab",
-                        host="gitlab.com",
-                        authentication=AuthenticationConfig(env="GITLAB_TOKEN"),
-                    ),
-                    IssueTrackerConfig(
-                        kind="gitlab",
-                        host="local.gitlab",
-                        authentication=AuthenticationConfig(env="LOCAL_GITLAB_TOKEN"),
-                    ),
-                ],
+            IssueTrackerConfig(
+                kind="github",
+                host="local.github",
+                authentication=AuthenticationConfig(env="LOCAL_GITHUB_TOKEN"),
             ),
-        ),
-    ],
-)
-def test_config_from_yaml_file(filename: str, expected: Config) -> None:
-    filepath = Path(__file__).parent / "data" / "config" / filename
-    actual = Config.from_yaml_file(filepath)
-    assert actual == expected
+            IssueTrackerConfig(
+                kind="gitlab",
+                host="gitlab.com",
+                authentication=AuthenticationConfig(env="GITLAB_TOKEN"),
+            ),
+        ],
+    ),
+    "config_1.yaml": Config(
+        scanners=["python"],
+        issue_trackers=[
+            IssueTrackerConfig(
+                kind="gitlab",
+                host="gitlab.com",
+                authentication=AuthenticationConfig(env="GITLAB_TOKEN"),
+            ),
+            IssueTrackerConfig(
+                kind="gitlab",
+                host="local.gitlab",
+                authentication=AuthenticationConfig(env="LOCAL_GITLAB_TOKEN"),
+            ),
+        ],
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def loaded_configs() -> dict[str, Config]:
+    # Parse every fixture file once for the whole module instead of once
+    # per parametrized case.
+    return {
+        filename: Config.from_yaml_file(CONFIG_PATH / filename)
+        for filename in EXPECTED_CONFIGS
+    }
+
+
+@pytest.mark.parametrize("filename", EXPECTED_CONFIGS)
+def test_config_from_yaml_file(
+    filename: str, loaded_configs: dict[str, Config]
+) -> None:
+    assert loaded_configs[filename] == EXPECTED_CONFIGS[filename]
+
+
+def test_config_from_yaml_file__memoized(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("scanners: [python]\n")
+    config = Config.from_yaml_file(config_file)
+    assert Config.from_yaml_file(config_file) is config
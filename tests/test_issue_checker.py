@@ -1,23 +1,38 @@
+import time
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 from unittest.mock import Mock
 
 import pytest
 from requests import HTTPError
 from requests_mock import Mocker as RequestsMock
+from requests_mock.request import _RequestObjectProxy
+from requests_mock.response import _Context
 
 from workaround_tracker.common import (
     AuthenticationConfig,
     IssueTrackerConfig,
-    Workaround,
+    WorkaroundData,
 )
 from workaround_tracker.issue_checker import IssueCheckerManager
 from workaround_tracker.issue_checker._base import IssueChecker
 from workaround_tracker.issue_checker._github import (
     GITHUB_MEDIA_TYPE,
+    GithubGraphQLError,
     GithubIssueChecker,
 )
-from workaround_tracker.issue_checker._gitlab import GitlabIssueChecker
-from workaround_tracker.issue_checker._manager import UnknownIssueResolutionError
+from workaround_tracker.issue_checker._gitlab import (
+    MAX_ISSUES_PER_REQUEST,
+    GitlabIssueChecker,
+)
+from workaround_tracker.issue_checker._manager import (
+    UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
+    IssueResolution,
+    IssueResolutionCache,
+    UnknownIssueResolutionError,
+)
 
 GITHUB_HOSTNAME = "mock.github"
 GITHUB_URL = f"https://{GITHUB_HOSTNAME}"
@@ -30,7 +45,12 @@ ISSUE_TRACKER_CONFIG_GITHUB = IssueTrackerConfig(
     host=GITHUB_HOSTNAME,
     authentication=AuthenticationConfig(env=GITHUB_AUTHENTICATION_ENV_VAR),
 )
-WORKAROUND = Workaround(file=Path("file"), line=47, url=GITHUB_ISSUE_URL)
+GITHUB_OTHER_ISSUE_URL = "https://mock.github/org/proj/issues/1235"
+GITHUB_SECOND_REPO_ISSUE_URL = "https://mock.github/org/other/issues/77"
+WORKAROUND = WorkaroundData(file=Path("file"), line=47, url=GITHUB_ISSUE_URL)
+OTHER_WORKAROUND = WorkaroundData(
+    file=Path("other_file"), line=3, url=GITHUB_OTHER_ISSUE_URL
+)
 GITHUB_REQUEST_HEADERS = {
     "Accept": GITHUB_MEDIA_TYPE,
     "Bearer": GITHUB_TOKEN,
@@ -54,7 +74,7 @@ GITLAB_REQUEST_HEADERS = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def github_issue_checker() -> GithubIssueChecker:
     return GithubIssueChecker(
         url=GITHUB_URL,
@@ -62,6 +82,12 @@ def github_issue_checker() -> GithubIssueChecker:
     )
 
 
+def test_github_issue_checker__netloc(
+    github_issue_checker: GithubIssueChecker,
+) -> None:
+    assert github_issue_checker.netloc == GITHUB_HOSTNAME
+
+
 def test_github_issue_checker__is_issue_resolved__true(
     github_issue_checker: GithubIssueChecker, requests_mock: RequestsMock
 ) -> None:
@@ -86,6 +112,20 @@ def test_github_issue_checker__is_issue_resolved__false(
     assert is_resolved is False
 
 
+def test_github_issue_checker__is_issue_resolved__fragment(
+    github_issue_checker: GithubIssueChecker, requests_mock: RequestsMock
+) -> None:
+    requests_mock.get(
+        GITHUB_API_ISSUE_URL,
+        json={"state": "closed"},
+        request_headers=GITHUB_REQUEST_HEADERS,
+    )
+    is_resolved = github_issue_checker.is_issue_resolved(
+        f"{GITHUB_ISSUE_URL}#issuecomment-456789"
+    )
+    assert is_resolved is True
+
+
 def test_github_issue_checker__is_issue_resolved__no_match(
     github_issue_checker: GithubIssueChecker,
 ) -> None:
@@ -95,6 +135,15 @@ def test_github_issue_checker__is_issue_resolved__no_match(
     assert is_resolved is None
 
 
+def test_github_issue_checker__is_issue_resolved__not_an_issue_url(
+    github_issue_checker: GithubIssueChecker,
+) -> None:
+    is_resolved = github_issue_checker.is_issue_resolved(
+        "https://mock.github/org/proj/pulls/5"
+    )
+    assert is_resolved is None
+
+
 def test_github_issue_checker__is_issue_resolved__error(
     github_issue_checker: GithubIssueChecker, requests_mock: RequestsMock
 ) -> None:
@@ -107,7 +156,76 @@ def test_github_issue_checker__is_issue_resolved__error(
         _ = github_issue_checker.is_issue_resolved(GITHUB_ISSUE_URL)
 
 
-@pytest.fixture
+def test_github_issue_checker__resolve_many(
+    github_issue_checker: GithubIssueChecker, requests_mock: RequestsMock
+) -> None:
+    requests_mock.post(
+        "https://api.mock.github/graphql",
+        json={
+            "data": {
+                "r0": {"i0": {"state": "CLOSED"}, "i1": {"state": "OPEN"}},
+                "r1": None,
+            }
+        },
+        request_headers=GITHUB_REQUEST_HEADERS,
+    )
+
+    results = github_issue_checker.resolve_many(
+        [
+            GITHUB_ISSUE_URL,
+            GITHUB_OTHER_ISSUE_URL,
+            GITHUB_SECOND_REPO_ISSUE_URL,
+            "https://some.github/org/proj/issues/1",
+            "https://mock.github/org/proj/pulls/5",
+        ]
+    )
+
+    assert results == {
+        GITHUB_ISSUE_URL: True,
+        GITHUB_OTHER_ISSUE_URL: False,
+        GITHUB_SECOND_REPO_ISSUE_URL: None,
+        "https://some.github/org/proj/issues/1": None,
+        "https://mock.github/org/proj/pulls/5": None,
+    }
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.json() == {
+        "query": (
+            "query ($owner_r0: String!, $name_r0: String!,"
+            " $owner_r1: String!, $name_r1: String!)"
+            " { r0: repository(owner: $owner_r0, name: $name_r0)"
+            " { i0: issue(number: 1234) { state } i1: issue(number: 1235) { state } }"
+            " r1: repository(owner: $owner_r1, name: $name_r1)"
+            " { i2: issue(number: 77) { state } } }"
+        ),
+        "variables": {
+            "owner_r0": "org",
+            "name_r0": "proj",
+            "owner_r1": "org",
+            "name_r1": "other",
+        },
+    }
+
+
+def test_github_issue_checker__resolve_many__graphql_error(
+    github_issue_checker: GithubIssueChecker, requests_mock: RequestsMock
+) -> None:
+    requests_mock.post(
+        "https://api.mock.github/graphql",
+        json={"errors": [{"message": "Problems parsing query"}]},
+        request_headers=GITHUB_REQUEST_HEADERS,
+    )
+    with pytest.raises(GithubGraphQLError):
+        _ = github_issue_checker.resolve_many([GITHUB_ISSUE_URL])
+
+
+def test_github_issue_checker__resolve_many__no_matching_urls(
+    github_issue_checker: GithubIssueChecker,
+) -> None:
+    url = "https://some.github/org/proj/issues/1"
+    assert github_issue_checker.resolve_many([url]) == {url: None}
+
+
+@pytest.fixture(scope="module")
 def gitlab_issue_checker() -> GitlabIssueChecker:
     return GitlabIssueChecker(
         url=GITLAB_URL,
@@ -115,6 +233,12 @@ def gitlab_issue_checker() -> GitlabIssueChecker:
     )
 
 
+def test_gitlab_issue_checker__netloc(
+    gitlab_issue_checker: GitlabIssueChecker,
+) -> None:
+    assert gitlab_issue_checker.netloc == GITLAB_HOSTNAME
+
+
 def test_gitlab_issue_checker__is_issue_resolved__true(
     gitlab_issue_checker: GitlabIssueChecker, requests_mock: RequestsMock
 ) -> None:
@@ -139,6 +263,20 @@ def test_gitlab_issue_checker__is_issue_resolved__false(
     assert is_resolved is False
 
 
+def test_gitlab_issue_checker__is_issue_resolved__query_string(
+    gitlab_issue_checker: GitlabIssueChecker, requests_mock: RequestsMock
+) -> None:
+    requests_mock.get(
+        GITLAB_API_ISSUE_URL,
+        json={"state": "closed"},
+        request_headers=GITLAB_REQUEST_HEADERS,
+    )
+    is_resolved = gitlab_issue_checker.is_issue_resolved(
+        f"{GITLAB_ISSUE_URL}?from=workaround#note_12"
+    )
+    assert is_resolved is True
+
+
 def test_gitlab_issue_checker__is_issue_resolved__no_match(
     gitlab_issue_checker: GitlabIssueChecker,
 ) -> None:
@@ -148,6 +286,15 @@ def test_gitlab_issue_checker__is_issue_resolved__no_match(
     assert is_resolved is None
 
 
+def test_gitlab_issue_checker__is_issue_resolved__not_an_issue_url(
+    gitlab_issue_checker: GitlabIssueChecker,
+) -> None:
+    is_resolved = gitlab_issue_checker.is_issue_resolved(
+        "https://mock.gitlab/group/proj/merge_requests/3"
+    )
+    assert is_resolved is None
+
+
 def test_gitlab_issue_checker__is_issue_resolved__error(
     gitlab_issue_checker: GitlabIssueChecker, requests_mock: RequestsMock
 ) -> None:
@@ -160,34 +307,157 @@ def test_gitlab_issue_checker__is_issue_resolved__error(
         _ = gitlab_issue_checker.is_issue_resolved(GITLAB_ISSUE_URL)
 
 
+def test_gitlab_issue_checker__resolve_many(
+    gitlab_issue_checker: GitlabIssueChecker, requests_mock: RequestsMock
+) -> None:
+    requests_mock.get(
+        f"https://{GITLAB_HOSTNAME}/api/v4/projects/group%2Fproj/issues",
+        json=[{"iid": 64, "state": "closed"}, {"iid": 65, "state": "opened"}],
+        request_headers=GITLAB_REQUEST_HEADERS,
+    )
+    requests_mock.get(
+        f"https://{GITLAB_HOSTNAME}/api/v4/projects/group%2Fsub%2Fproj/issues",
+        json=[{"iid": 7, "state": "closed"}],
+        request_headers=GITLAB_REQUEST_HEADERS,
+    )
+    other_issue_url = f"https://{GITLAB_HOSTNAME}/group/proj/issues/65"
+    missing_issue_url = f"https://{GITLAB_HOSTNAME}/group/proj/issues/66"
+    subgroup_issue_url = f"https://{GITLAB_HOSTNAME}/group/sub/proj/-/issues/7"
+
+    results = gitlab_issue_checker.resolve_many(
+        [
+            GITLAB_ISSUE_URL,
+            other_issue_url,
+            missing_issue_url,
+            subgroup_issue_url,
+            "https://some.gitlab/group/proj/issues/1",
+            f"https://{GITLAB_HOSTNAME}/group/proj/merge_requests/3",
+        ]
+    )
+
+    assert results == {
+        GITLAB_ISSUE_URL: True,
+        other_issue_url: False,
+        missing_issue_url: None,
+        subgroup_issue_url: True,
+        "https://some.gitlab/group/proj/issues/1": None,
+        f"https://{GITLAB_HOSTNAME}/group/proj/merge_requests/3": None,
+    }
+    assert requests_mock.request_history[0].qs == {
+        "iids[]": ["64", "65", "66"],
+        "per_page": [str(MAX_ISSUES_PER_REQUEST)],
+    }
+    assert requests_mock.request_history[1].qs == {
+        "iids[]": ["7"],
+        "per_page": [str(MAX_ISSUES_PER_REQUEST)],
+    }
+
+
+def test_gitlab_issue_checker__resolve_many__batched(
+    gitlab_issue_checker: GitlabIssueChecker, requests_mock: RequestsMock
+) -> None:
+    def issues_response(
+        request: _RequestObjectProxy, context: _Context
+    ) -> list[dict[str, object]]:
+        return [
+            {"iid": int(issue_id), "state": "closed"}
+            for issue_id in request.qs["iids[]"]
+        ]
+
+    requests_mock.get(
+        f"https://{GITLAB_HOSTNAME}/api/v4/projects/group%2Fproj/issues",
+        json=issues_response,
+        request_headers=GITLAB_REQUEST_HEADERS,
+    )
+    urls = [
+        f"https://{GITLAB_HOSTNAME}/group/proj/issues/{number}"
+        for number in range(1, MAX_ISSUES_PER_REQUEST + 51)
+    ]
+
+    results = gitlab_issue_checker.resolve_many(urls)
+
+    assert results == {url: True for url in urls}
+    assert len(requests_mock.request_history) == 2
+    first_qs = requests_mock.request_history[0].qs
+    second_qs = requests_mock.request_history[1].qs
+    assert len(first_qs["iids[]"]) == MAX_ISSUES_PER_REQUEST
+    assert len(second_qs["iids[]"]) == 50
+    assert first_qs["per_page"] == [str(MAX_ISSUES_PER_REQUEST)]
+    assert second_qs["per_page"] == [str(MAX_ISSUES_PER_REQUEST)]
+
+
+class StubIssueChecker(IssueChecker):
+    """Minimal IssueChecker stand-in that records the urls it is asked about.
+
+    Cheaper to build per test than Mock(spec=...), which introspects the
+    class on every construction.
+    """
+
+    def __init__(
+        self, is_resolved: Optional[bool], netloc: Optional[str] = None
+    ) -> None:
+        self._is_resolved = is_resolved
+        self.checked_urls: list[str] = []
+        self.netloc = netloc
+
+    def is_issue_resolved(self, url: str) -> Optional[bool]:
+        self.checked_urls.append(url)
+        return self._is_resolved
+
+
+class StubBulkIssueChecker(StubIssueChecker):
+    """Stub that also resolves urls in bulk; unknown urls resolve to None."""
+
+    def __init__(self, resolutions: dict[str, Optional[bool]]) -> None:
+        super().__init__(is_resolved=None)
+        self._resolutions = dict(resolutions)
+        self.bulk_checked_urls: list[list[str]] = []
+
+    def resolve_many(self, urls: Iterable[str]) -> dict[str, Optional[bool]]:
+        url_list = list(urls)
+        self.bulk_checked_urls.append(url_list)
+        return {url: self._resolutions.get(url) for url in url_list}
+
+
 @pytest.fixture
-def mock_issue_checker__true() -> Mock:
-    return Mock(spec=IssueChecker, is_issue_resolved=Mock(return_value=True))
+def stub_issue_checker__true() -> StubIssueChecker:
+    return StubIssueChecker(is_resolved=True)
 
 
 @pytest.fixture
-def mock_issue_checker__none() -> Mock:
-    return Mock(spec=IssueChecker, is_issue_resolved=Mock(return_value=None))
+def stub_issue_checker__none() -> StubIssueChecker:
+    return StubIssueChecker(is_resolved=None)
 
 
 @pytest.fixture
-def issue_checker_manager(
-    mock_issue_checker__none: IssueChecker, mock_issue_checker__true: IssueChecker
-) -> IssueCheckerManager:
-    return IssueCheckerManager(
-        issue_checkers=[mock_issue_checker__none, mock_issue_checker__true]
-    )
+def stub_issue_checker__resolve_many() -> StubBulkIssueChecker:
+    return StubBulkIssueChecker({WORKAROUND.url: True, OTHER_WORKAROUND.url: None})
 
 
 def test_issue_checker_manager__is_workaround_redundant(
-    mock_issue_checker__none: Mock, mock_issue_checker__true: Mock
+    stub_issue_checker__none: StubIssueChecker,
+    stub_issue_checker__true: StubIssueChecker,
 ) -> None:
     manager = IssueCheckerManager(
-        issue_checkers=[mock_issue_checker__none, mock_issue_checker__true]
+        issue_checkers=[stub_issue_checker__none, stub_issue_checker__true]
     )
     is_redundant = manager.is_workaround_redundant(WORKAROUND)
-    mock_issue_checker__none.is_issue_resolved.assert_called_once_with(WORKAROUND.url)
-    mock_issue_checker__true.is_issue_resolved.assert_called_once_with(WORKAROUND.url)
+    assert stub_issue_checker__none.checked_urls == [WORKAROUND.url]
+    assert stub_issue_checker__true.checked_urls == [WORKAROUND.url]
+    assert is_redundant is True
+
+
+def test_issue_checker_manager__is_workaround_redundant__netloc_dispatch() -> None:
+    other_netloc_checker = StubIssueChecker(
+        is_resolved=None, netloc="some.other.netloc"
+    )
+    matching_netloc_checker = StubIssueChecker(is_resolved=True, netloc=GITHUB_HOSTNAME)
+    manager = IssueCheckerManager(
+        issue_checkers=[other_netloc_checker, matching_netloc_checker]
+    )
+    is_redundant = manager.is_workaround_redundant(WORKAROUND)
+    assert other_netloc_checker.checked_urls == []
+    assert matching_netloc_checker.checked_urls == [WORKAROUND.url]
     assert is_redundant is True
 
 
@@ -198,18 +468,153 @@ def test_issue_checker_manager__is_workaround_redundant__no_checkers() -> None:
 
 
 def test_issue_checker_manager__is_workaround_redundant__error(
-    mock_issue_checker__none: Mock,
+    stub_issue_checker__none: StubIssueChecker,
 ) -> None:
-    manager = IssueCheckerManager(issue_checkers=[mock_issue_checker__none])
+    manager = IssueCheckerManager(issue_checkers=[stub_issue_checker__none])
     with pytest.raises(UnknownIssueResolutionError):
         _ = manager.is_workaround_redundant(WORKAROUND)
-    mock_issue_checker__none.is_issue_resolved.assert_called_once_with(WORKAROUND.url)
+    assert stub_issue_checker__none.checked_urls == [WORKAROUND.url]
 
 
-@pytest.fixture
-def _set_token_environment_variables(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_issue_resolution_cache__round_trip(tmp_path: Path) -> None:
+    cache = IssueResolutionCache(
+        urls={
+            GITHUB_ISSUE_URL: IssueResolution(is_resolved=True, timestamp=1234.0),
+            GITLAB_ISSUE_URL: IssueResolution(is_resolved=False, timestamp=5678.0),
+        }
+    )
+    cache_file = tmp_path / "issues.json"
+    cache.write_to_json_file(cache_file)
+    assert IssueResolutionCache.from_json_file(cache_file) == cache
+
+
+def test_issue_checker_manager__are_workarounds_redundant__cached_on_disk(
+    stub_issue_checker__none: StubIssueChecker,
+) -> None:
+    resolution_cache = IssueResolutionCache(
+        urls={
+            WORKAROUND.url: IssueResolution(is_resolved=True, timestamp=0.0),
+            OTHER_WORKAROUND.url: IssueResolution(
+                is_resolved=False, timestamp=time.time()
+            ),
+        }
+    )
+    manager = IssueCheckerManager(
+        issue_checkers=[stub_issue_checker__none],
+        resolution_cache=resolution_cache,
+    )
+
+    results = manager.are_workarounds_redundant([WORKAROUND, OTHER_WORKAROUND])
+
+    assert stub_issue_checker__none.checked_urls == []
+    assert results == {WORKAROUND.url: True, OTHER_WORKAROUND.url: False}
+    assert manager.resolution_cache is resolution_cache
+
+
+def test_issue_checker_manager__are_workarounds_redundant__stale_cache(
+    stub_issue_checker__true: StubIssueChecker,
+) -> None:
+    resolution_cache = IssueResolutionCache(
+        urls={
+            WORKAROUND.url: IssueResolution(
+                is_resolved=False,
+                timestamp=time.time() - UNRESOLVED_ISSUE_CACHE_TTL_SECONDS - 1,
+            )
+        }
+    )
+    manager = IssueCheckerManager(
+        issue_checkers=[stub_issue_checker__true],
+        resolution_cache=resolution_cache,
+    )
+
+    results = manager.are_workarounds_redundant([WORKAROUND])
+
+    assert stub_issue_checker__true.checked_urls == [WORKAROUND.url]
+    assert results == {WORKAROUND.url: True}
+    assert resolution_cache.urls[WORKAROUND.url].is_resolved is True
+
+
+def test_issue_checker_manager__are_workarounds_redundant__concurrency_env(
+    monkeypatch: pytest.MonkeyPatch, stub_issue_checker__true: StubIssueChecker
+) -> None:
+    monkeypatch.setenv("WT_HTTP_CONCURRENCY", "2")
+    monkeypatch.setattr(
+        "workaround_tracker.issue_checker._manager.ThreadPoolExecutor",
+        mock_executor_cls := Mock(wraps=ThreadPoolExecutor),
+    )
+    manager = IssueCheckerManager(issue_checkers=[stub_issue_checker__true])
+
+    results = manager.are_workarounds_redundant([WORKAROUND])
+
+    mock_executor_cls.assert_called_once_with(max_workers=2)
+    assert results == {WORKAROUND.url: True}
+
+
+def test_issue_checker_manager__are_workarounds_redundant__custom_ttl(
+    stub_issue_checker__none: StubIssueChecker,
+) -> None:
+    resolution_cache = IssueResolutionCache(
+        urls={
+            WORKAROUND.url: IssueResolution(
+                is_resolved=False,
+                timestamp=time.time() - UNRESOLVED_ISSUE_CACHE_TTL_SECONDS - 1,
+            )
+        }
+    )
+    manager = IssueCheckerManager(
+        issue_checkers=[stub_issue_checker__none],
+        resolution_cache=resolution_cache,
+        unresolved_ttl=2 * UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
+    )
+
+    results = manager.are_workarounds_redundant([WORKAROUND])
+
+    assert stub_issue_checker__none.checked_urls == []
+    assert results == {WORKAROUND.url: False}
+
+
+def test_issue_checker_manager__are_workarounds_redundant(
+    stub_issue_checker__resolve_many: StubBulkIssueChecker,
+    stub_issue_checker__true: StubIssueChecker,
+) -> None:
+    manager = IssueCheckerManager(
+        issue_checkers=[stub_issue_checker__resolve_many, stub_issue_checker__true]
+    )
+
+    results = manager.are_workarounds_redundant(
+        [WORKAROUND, OTHER_WORKAROUND, WORKAROUND]
+    )
+
+    assert stub_issue_checker__resolve_many.bulk_checked_urls == [
+        [WORKAROUND.url, OTHER_WORKAROUND.url]
+    ]
+    assert stub_issue_checker__true.checked_urls == [OTHER_WORKAROUND.url]
+    assert results == {WORKAROUND.url: True, OTHER_WORKAROUND.url: True}
+
+
+def test_issue_checker_manager__are_workarounds_redundant__all_bulk(
+    stub_issue_checker__none: StubIssueChecker,
+) -> None:
+    bulk_issue_checker = StubBulkIssueChecker({WORKAROUND.url: False})
+    manager = IssueCheckerManager(
+        issue_checkers=[bulk_issue_checker, stub_issue_checker__none]
+    )
+
+    results = manager.are_workarounds_redundant([WORKAROUND])
+
+    assert stub_issue_checker__none.checked_urls == []
+    assert results == {WORKAROUND.url: False}
+
+
+@pytest.fixture(scope="session")
+def _set_token_environment_variables() -> Generator[None, None, None]:
+    # The function-scoped monkeypatch fixture cannot back a session fixture,
+    # so drive a MonkeyPatch instance directly and undo it on teardown.
+    monkeypatch = pytest.MonkeyPatch()
     monkeypatch.setenv(GITHUB_AUTHENTICATION_ENV_VAR, GITHUB_TOKEN)
     monkeypatch.setenv(GITLAB_AUTHENTICATION_ENV_VAR, GITLAB_TOKEN)
+    yield
+    monkeypatch.undo()
 
 
 @pytest.mark.usefixtures("_set_token_environment_variables")
@@ -1,4 +1,3 @@
-import itertools
 from pathlib import Path
 from unittest.mock import Mock, call
 
@@ -7,13 +6,18 @@ from click.testing import CliRunner
 from requests_mock import Mocker as RequestsMock
 
 from workaround_tracker.code_scanner import CodeScannerCache, CodeScannerManager
-from workaround_tracker.common import CACHE_FILE_NAME, Config, Workaround
-from workaround_tracker.issue_checker import IssueCheckerManager
+from workaround_tracker.common import CACHE_FILE_NAME, Config, WorkaroundData
+from workaround_tracker.issue_checker import (
+    UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
+    IssueCheckerManager,
+    IssueResolutionCache,
+)
 from workaround_tracker.issue_checker._github import GITHUB_MEDIA_TYPE
 from workaround_tracker.main import (
     EXIT_CODE_REDUNDANT_WORKAROUNDS,
     check,
     read_cache_file,
+    read_issue_cache_file,
     setup_logging,
 )
 
@@ -28,7 +32,7 @@ def mock_code_scanner_cache(monkeypatch: pytest.MonkeyPatch) -> Mock:
 
 
 def test_read_cache_file__exists(tmp_path: Path, mock_code_scanner_cache: Mock) -> None:
-    cache_file = tmp_path / "cache.yml"
+    cache_file = tmp_path / "cache.json"
     cache_file.touch()
     actual = read_cache_file(cache_file)
     mock_code_scanner_cache.from_json_file.assert_called_once_with(cache_file)
@@ -38,13 +42,42 @@ def test_read_cache_file__exists(tmp_path: Path, mock_code_scanner_cache: Mock)
 def test_read_cache_file__does_not_exists(
     tmp_path: Path, mock_code_scanner_cache: Mock
 ) -> None:
-    cache_file = tmp_path / "cache.yml"
+    cache_file = tmp_path / "cache.json"
     actual = read_cache_file(cache_file)
     mock_code_scanner_cache.assert_called_once_with()
     mock_code_scanner_cache.from_json_file.assert_not_called()
     assert actual is mock_code_scanner_cache.return_value
 
 
+@pytest.fixture
+def mock_issue_resolution_cache(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    monkeypatch.setattr(
+        "workaround_tracker.main.IssueResolutionCache",
+        mock_object := Mock(spec=IssueResolutionCache),
+    )
+    return mock_object
+
+
+def test_read_issue_cache_file__exists(
+    tmp_path: Path, mock_issue_resolution_cache: Mock
+) -> None:
+    issue_cache_file = tmp_path / "cache.issues.json"
+    issue_cache_file.touch()
+    actual = read_issue_cache_file(issue_cache_file)
+    mock_issue_resolution_cache.from_json_file.assert_called_once_with(issue_cache_file)
+    assert actual is mock_issue_resolution_cache.from_json_file.return_value
+
+
+def test_read_issue_cache_file__does_not_exists(
+    tmp_path: Path, mock_issue_resolution_cache: Mock
+) -> None:
+    issue_cache_file = tmp_path / "cache.issues.json"
+    actual = read_issue_cache_file(issue_cache_file)
+    mock_issue_resolution_cache.assert_called_once_with()
+    mock_issue_resolution_cache.from_json_file.assert_not_called()
+    assert actual is mock_issue_resolution_cache.return_value
+
+
 @pytest.fixture
 def mock_read_cache_file(monkeypatch: pytest.MonkeyPatch) -> Mock:
     monkeypatch.setattr(
@@ -54,6 +87,15 @@ def mock_read_cache_file(monkeypatch: pytest.MonkeyPatch) -> Mock:
     return mock_object
 
 
+@pytest.fixture
+def mock_read_issue_cache_file(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    monkeypatch.setattr(
+        "workaround_tracker.main.read_issue_cache_file",
+        mock_object := Mock(spec=read_issue_cache_file),
+    )
+    return mock_object
+
+
 @pytest.fixture
 def mock_config(monkeypatch: pytest.MonkeyPatch) -> Mock:
     monkeypatch.setattr(
@@ -62,10 +104,10 @@ def mock_config(monkeypatch: pytest.MonkeyPatch) -> Mock:
     return mock_object
 
 
-WORKAROUND_RESOLVED = Workaround(
+WORKAROUND_RESOLVED = WorkaroundData(
     file=Path("file"), line=12, url="https://issue.tracker/issue/11"
 )
-WORKAROUND_UNRESOLVED = Workaround(
+WORKAROUND_UNRESOLVED = WorkaroundData(
     file=Path("other_file"), line=36, url="https://issue.tracker/issue/14"
 )
 
@@ -89,24 +131,26 @@ def mock_issue_checker_manager(monkeypatch: pytest.MonkeyPatch) -> Mock:
         "workaround_tracker.main.IssueCheckerManager",
         mock_object := Mock(spec=IssueCheckerManager),
     )
-    mock_object.from_config.return_value.is_workaround_redundant.side_effect = [
-        True,
-        False,
-    ]
+    mock_object.from_config.return_value.are_workarounds_redundant.side_effect = (
+        lambda workarounds: {
+            workaround.url: workaround == WORKAROUND_RESOLVED
+            for workaround in workarounds
+        }
+    )
     return mock_object
 
 
-def test_check__help() -> None:
-    result = CliRunner().invoke(check, ["--help"])
+def test_check__help(cli_runner: CliRunner) -> None:
+    result = cli_runner.invoke(check, ["--help"])
     assert result.exit_code == 0
     assert result.stdout
 
 
 @pytest.fixture
 def existing_config_file(tmp_path: Path) -> Path:
-    cache_file = tmp_path / "cache.yml"
-    cache_file.touch()
-    return cache_file
+    config_file = tmp_path / "config.yaml"
+    config_file.touch()
+    return config_file
 
 
 @pytest.fixture
@@ -123,19 +167,22 @@ def test_check__no_source_paths(
     existing_config_file: Path,
     mock_setup_logging: Mock,
     mock_read_cache_file: Mock,
+    mock_read_issue_cache_file: Mock,
     mock_config: Mock,
     mock_code_scanner_manager: Mock,
     mock_issue_checker_manager: Mock,
     tmp_path: Path,
     debug: bool,
+    cli_runner: CliRunner,
 ) -> None:
     command = ["--config-file", str(existing_config_file)]
     if debug:
         command.append("--debug")
-    result = CliRunner().invoke(check, command)
+    result = cli_runner.invoke(check, command, catch_exceptions=False)
 
     mock_setup_logging.assert_called_once_with(debug=debug)
     mock_read_cache_file.assert_not_called()
+    mock_read_issue_cache_file.assert_not_called()
     mock_config.assert_not_called()
     mock_code_scanner_manager.assert_not_called()
     mock_issue_checker_manager.assert_not_called()
@@ -143,74 +190,101 @@ def test_check__no_source_paths(
 
 
 @pytest.mark.parametrize(
-    "use_cache, provide_cache_file", itertools.product([True, False], [True, False])
+    "use_cache, provide_cache_file",
+    [(True, True), (True, False), (False, True), (False, False)],
 )
 def test_check(
-    tmp_path_factory: pytest.TempPathFactory,
     existing_config_file: Path,
     mock_setup_logging: Mock,
     mock_read_cache_file: Mock,
+    mock_read_issue_cache_file: Mock,
     mock_config: Mock,
     mock_code_scanner_manager: Mock,
     mock_issue_checker_manager: Mock,
     tmp_path: Path,
     use_cache: bool,
     provide_cache_file: bool,
+    cli_runner: CliRunner,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    source_paths = [tmp_path_factory.mktemp("src0"), tmp_path_factory.mktemp("src1")]
+    source_paths = [tmp_path / "src0", tmp_path / "src1"]
+    for source_path in source_paths:
+        source_path.mkdir()
     command: list[str] = [str(source_path) for source_path in source_paths]
 
     command.append("--config-file")
     command.append(str(existing_config_file))
 
-    cache_file = Path.cwd() / CACHE_FILE_NAME
+    # The default cache file lands in the working directory; run from tmp
+    # so the test never writes into the project directory.
+    monkeypatch.chdir(tmp_path)
+    cache_file = tmp_path / CACHE_FILE_NAME
     if provide_cache_file:
-        cache_file = tmp_path_factory.mktemp("cache.json")
+        cache_file = tmp_path / "cache.json"
         command.append("--cache-file")
         command.append(str(cache_file))
-    cache_file.touch()
+    if use_cache and provide_cache_file:
+        cache_file.touch()
 
     if not use_cache:
         command.append("--no-cache")
 
-    result = CliRunner().invoke(check, command)
+    result = cli_runner.invoke(check, command, catch_exceptions=False)
 
+    issue_cache_file = cache_file.with_suffix(".issues.json")
     mock_setup_logging.assert_called_once_with(debug=False)
     if use_cache:
         mock_read_cache_file.assert_called_once_with(cache_file)
+        mock_read_issue_cache_file.assert_called_once_with(issue_cache_file)
         mock_code_scanner_manager.from_scanner_strings.assert_called_once_with(
             strings=mock_config.from_yaml_file.return_value.scanners,
             cache=mock_read_cache_file.return_value,
+            jobs=None,
+        )
+        mock_issue_checker_manager.from_config.assert_called_once_with(
+            mock_config.from_yaml_file.return_value.issue_trackers,
+            resolution_cache=mock_read_issue_cache_file.return_value,
+            unresolved_ttl=UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
         )
     else:
         mock_read_cache_file.assert_not_called()
+        mock_read_issue_cache_file.assert_not_called()
         mock_code_scanner_manager.from_scanner_strings.assert_called_once_with(
-            strings=mock_config.from_yaml_file.return_value.scanners, cache=None
+            strings=mock_config.from_yaml_file.return_value.scanners,
+            cache=None,
+            jobs=None,
+        )
+        mock_issue_checker_manager.from_config.assert_called_once_with(
+            mock_config.from_yaml_file.return_value.issue_trackers,
+            resolution_cache=None,
+            unresolved_ttl=UNRESOLVED_ISSUE_CACHE_TTL_SECONDS,
         )
     mock_config.from_yaml_file.assert_called_once_with(existing_config_file)
-    mock_issue_checker_manager.from_config.assert_called_once_with(
-        mock_config.from_yaml_file.return_value.issue_trackers
-    )
     assert (
         mock_code_scanner_manager.from_scanner_strings.return_value.scan_path.mock_calls
         == [call(source_path) for source_path in source_paths]
     )
-    assert (
-        mock_issue_checker_manager.from_config.return_value.is_workaround_redundant.mock_calls
-        == [call(WORKAROUND_RESOLVED), call(WORKAROUND_UNRESOLVED)]
+    mock_issue_checker_manager.from_config.return_value.are_workarounds_redundant.assert_called_once_with(
+        [WORKAROUND_RESOLVED, WORKAROUND_UNRESOLVED]
     )
     if use_cache:
         mock_code_scanner_manager.from_scanner_strings.return_value.cache.write_to_json_file.assert_called_once_with(
             cache_file
         )
+        mock_issue_checker_manager.from_config.return_value.resolution_cache.write_to_json_file.assert_called_once_with(
+            issue_cache_file
+        )
     else:
         mock_code_scanner_manager.from_scanner_strings.return_value.cache.write_to_json_file.assert_not_called()
+        mock_issue_checker_manager.from_config.return_value.resolution_cache.write_to_json_file.assert_not_called()
     assert result.exit_code == EXIT_CODE_REDUNDANT_WORKAROUNDS
 
 
 @pytest.mark.integration_test
 def test_check__integration(
-    requests_mock: RequestsMock, monkeypatch: pytest.MonkeyPatch
+    requests_mock: RequestsMock,
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: CliRunner,
 ) -> None:
     github_token = "gh_my_token"
     gitlab_token = "gl_my_token"
@@ -224,29 +298,29 @@ def test_check__integration(
     gitlab_request_headers = {
         "PRIVATE-TOKEN": gitlab_token,
     }
-    requests_mock.get(
-        "https://api.github.com/repos/litestar-org/litestar/issues/3630",
-        json={"state": "closed"},
+    requests_mock.post(
+        "https://api.github.com/graphql",
+        json={
+            "data": {
+                "r0": {"i0": {"state": "CLOSED"}},
+                "r1": {"i1": {"state": "OPEN"}},
+            }
+        },
         request_headers=github_request_headers,
         headers={"Content-Type": GITHUB_MEDIA_TYPE},
     )
     requests_mock.get(
-        "https://gitlab.com/api/v4/projects/gitlab-org%2Fgitlab-runner/issues/37983",
-        json={"state": "closed"},
+        "https://gitlab.com/api/v4/projects/gitlab-org%2Fgitlab-runner/issues",
+        json=[{"iid": 37983, "state": "closed"}],
         request_headers=gitlab_request_headers,
     )
-    requests_mock.get(
-        "https://api.github.com/repos/mam-dev/security-constraints/issues/32",
-        json={"state": "open"},
-        request_headers=github_request_headers,
-        headers={"Content-Type": GITHUB_MEDIA_TYPE},
-    )
     config_file = Path(__file__).parent / "data" / "config" / "config_0.yaml"
     source_path = Path(__file__).parent / "data" / "code"
 
-    result = CliRunner().invoke(
+    result = cli_runner.invoke(
         check,
         [str(source_path), "--no-cache", "--config-file", str(config_file), "--debug"],
+        catch_exceptions=False,
     )
     assert result.exit_code == EXIT_CODE_REDUNDANT_WORKAROUNDS
     assert (